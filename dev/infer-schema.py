@@ -11,7 +11,18 @@ from __future__ import annotations
 import sys
 import json
 import argparse
-from collections import defaultdict
+
+import orjson
+
+# JSON types are concrete, so dispatch on the exact type. Anything else is a string
+_TYPES = {
+    dict: "object",
+    list: "array",
+    int: "number",
+    float: "number",
+    bool: "boolean",
+    type(None): "null",
+}
 
 
 def log(*args, **kwargs):
@@ -29,9 +40,9 @@ def serialize(obj):
     return obj
 
 
-def get_record(line: str, *, is_singer_format=False) -> dict | None:
+def get_record(line: bytes, *, is_singer_format=False) -> dict | None:
     try:
-        record = json.loads(line)
+        record = orjson.loads(line)
 
         if not isinstance(record, dict):
             log(f"row doesn't look like a record: {line!r}")
@@ -43,7 +54,7 @@ def get_record(line: str, *, is_singer_format=False) -> dict | None:
         if record.get("type") == "RECORD":
             return record.get("record")
 
-    except json.JSONDecodeError as err:
+    except orjson.JSONDecodeError as err:
         log(f"failed to pass {line!r}, error: {err}")
 
     return None
@@ -64,11 +75,11 @@ def main() -> int:
 
     args = parser.parse_args()
 
-    properties = defaultdict(lambda: {"type": {"null"}})
+    # every key may be missing from some records, so all types include null
+    types_by_key: dict[str, set[str]] = {}
 
-    schema = {"type": "object", "properties": properties}
-
-    for line in sys.stdin.read().split("\n"):
+    for line in sys.stdin.buffer:
+        line = line.rstrip(b"\n")
         if line:
             record = get_record(line, is_singer_format=args.singer_style)
 
@@ -77,25 +88,14 @@ def main() -> int:
 
             else:
                 for key, value in record.items():
-                    if isinstance(value, dict):
-                        _type = "object"
-
-                    elif isinstance(value, list):
-                        _type = "array"
+                    _type = _TYPES.get(type(value), "string")
+                    types = types_by_key.get(key)
+                    if types is None:
+                        types = types_by_key[key] = {"null"}
+                    types.add(_type)
 
-                    elif isinstance(value, (int, float)):
-                        _type = "number"
-
-                    elif isinstance(value, bool):
-                        _type = "bool"
-
-                    elif value is None:
-                        _type = "null"
-
-                    else:  # string is the default type
-                        _type = "string"
-
-                    schema["properties"][key]["type"].add(_type)
+    properties = {key: {"type": types} for key, types in types_by_key.items()}
+    schema = {"type": "object", "properties": properties}
 
     if args.required:
         schema["required"] = {"company_name"} | set(args.required)
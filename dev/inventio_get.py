@@ -4,9 +4,9 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 
+import orjson
 import requests
 import xmltodict
 
@@ -15,8 +15,12 @@ def log(*args, **kwargs):
     print(*args, **kwargs, file=sys.stderr)
 
 
+# record tags are always lists, even when a response holds a single record
+RECORD_TAGS = ("entry", "dimension-entry", "customer")
+
+
 def get(url) -> dict:
-    return xmltodict.parse(requests.get(url).content)
+    return xmltodict.parse(requests.get(url).content, force_list=RECORD_TAGS)
 
 
 def main(argv: str | None = None) -> int:
@@ -63,13 +67,14 @@ def main(argv: str | None = None) -> int:
 
     try:
         print(
-            json.dumps(
+            orjson.dumps(
                 content_json,
-                **({"indent": 2, "default": str} if args.pretty else {}),
-            ),
+                option=orjson.OPT_INDENT_2 if args.pretty else 0,
+                default=str,
+            ).decode(),
         )
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONEncodeError as e:
         log(f"failed to parse result json: {e}")
         exit_code = 1
 
@@ -2,21 +2,26 @@
 
 from __future__ import annotations
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterable, TypedDict
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, TypedDict
 
+import requests
 import xmltodict
+from requests.adapters import HTTPAdapter
+from singer_sdk import metrics
 from singer_sdk.exceptions import FatalAPIError
-from singer_sdk.helpers.jsonpath import extract_jsonpath
-from singer_sdk.pagination import BaseAPIPaginator
 from singer_sdk.streams import RESTStream
 
 if TYPE_CHECKING:
-    import requests
     from typing_extensions import NotRequired
 
 SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")
 
+# Number of companies requested concurrently, unless set in the config
+DEFAULT_MAX_WORKERS = 8
+
 
 class EndpointConfig(TypedDict):
     """Basic shape of the configuration for each tap.
@@ -29,62 +34,42 @@ class EndpointConfig(TypedDict):
 
 
 class PaginatorResponse(TypedDict):
-    """Format of the paginator response. Each 'page' is a company token pair."""
+    """Format of the page token. Each 'page' is a company token pair."""
 
     company_name: str
     token: str
 
 
+@lru_cache(maxsize=256)
 def normalise_name(name: str) -> str | None:
     """Normalise endpoint names.
 
     eg: 'GLEntry-GET'   -> GLENTRY
         'ITEM-POST'     -> None (don't work with post endpoints).
     """
-    if name.upper().endswith("-POST"):
+    if name.isupper() and "-" not in name:
+        return name  # already normalised, eg: 'GLENTRY'
+
+    upper_name = name.upper()
+    if upper_name.endswith("-POST"):
         return None
-    return name.upper().removesuffix("-GET")
+    return upper_name.removesuffix("-GET")
 
 
-class CompanyAPIPaginator(BaseAPIPaginator):
-    """Paginates over a list of companies (yes, very odd).
+@lru_cache(maxsize=1)
+def pooled_session(pool_maxsize: int) -> requests.Session:
+    """Session shared by all streams, so connections to the API are reused.
 
-    The inventio api doesn't have page-pagination,
-    but we want to get data for many companies.
+    Every request goes to the same host, with up to 'pool_maxsize' companies
+    requested at once. Keeping a connection alive for each of them saves a
+    TCP/TLS handshake per page.
     """
-
-    def __init__(self, start_value: dict[str, str]) -> None:
-        """Create a new paginator.
-
-        Args:
-            start_value: Initial value.
-        """
-        self._companies_and_keys = iter(start_value.items())
-        company_name, token = next(self._companies_and_keys)
-        super().__init__({"company_name": company_name, "token": token})
-
-    def get_next(
-        self,
-        response: requests.Response,  # noqa: ARG002
-    ) -> PaginatorResponse | None:
-        """Get the next pagination token or index from the API response.
-
-        Args:
-            response: API response object.
-
-        Returns:
-            The next page token or index. Return `None` from this method to indicate
-                the end of pagination.
-        """
-        try:
-            company_name, token = next(self._companies_and_keys)
-            self._page_count += 1
-
-        except StopIteration:
-            return None
-
-        else:
-            return {"company_name": company_name, "token": token}
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize),
+    )
+    return session
 
 
 class InventioStream(RESTStream):
@@ -93,19 +78,41 @@ class InventioStream(RESTStream):
     # path is required by design of the RESTStream. it is not used
     path = None
 
-    _current_company_name: str | None = None
-
     forced_replication_method = (
         "FULL_TABLE"  # Currently no stream has state implemented
     )
 
-    @property
-    def url_base(self) -> str:
-        """Return the API URL root, configurable via tap settings."""
-        # Note that '{company_name}' will be replaced by values found in
-        # context and config by the function 'get_url()'
-        # (and 'next_page_token' by 'prepare_request()')
-        return "https://app.cloud.inventio.it/{company_name}/smartapi/"
+    # Note that '{company_name}' will be replaced by values found in
+    # context and config by the function 'get_url()'
+    # (and 'next_page_token' by 'prepare_request()')
+    url_base = "https://app.cloud.inventio.it/{company_name}/smartapi/"
+
+    # Value of the 'type' query parameter, set for each stream class
+    _type_param: str
+
+    # Tags leading to each record in the XML document, eg: <entries><entry>
+    _record_path: tuple[str, ...] = ("entries", "entry")
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Build the 'type' query parameter once for each stream class."""
+        super().__init_subclass__(**kwargs)
+        if name := getattr(cls, "name", None):
+            cls._type_param = f"{name}-GET"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Create a new stream and resolve its endpoint config."""
+        super().__init__(*args, **kwargs)
+
+        # The config is fixed for the life of the stream, so look this up once
+        endpoint_configs = {
+            normalise_name(endpoint_name): config
+            for endpoint_name, config in self.config["endpoints"].items()
+        }
+        self._endpoint_config: EndpointConfig | None = endpoint_configs.get(
+            normalise_name(self.name),
+        )
+        self._selected_by_default = self._endpoint_config is not None
+        self._max_workers: int = self.config.get("max_workers", DEFAULT_MAX_WORKERS)
 
     @property
     def schema_filepath(self) -> Path | None:
@@ -128,36 +135,82 @@ class InventioStream(RESTStream):
             headers["User-Agent"] = self.config.get("user_agent")
         return headers
 
+    @property
+    def requests_session(self) -> requests.Session:
+        """Get the pooled session shared by all streams."""
+        return pooled_session(self._max_workers)
+
     @property
     def endpoint_config(self) -> EndpointConfig | None:
         """The config that corresponds only to this endpoint (or None)."""
-        for endpoint_name, config in self.config["endpoints"].items():
-            if normalise_name(endpoint_name) == normalise_name(self.name):
-                return config
-        return None
+        return self._endpoint_config
 
     @property
     def selected_by_default(self) -> bool:
         """Selected by default in singer catalog if there is an available config."""
-        return self.endpoint_config is not None
+        return self._selected_by_default
 
-    def get_new_paginator(self) -> CompanyAPIPaginator:
-        """Create a new pagination helper instance.
+    def request_records(self, context: dict | None) -> Iterable[dict]:
+        """Request records for every configured company.
 
-        If the source API can make use of the `next_page_token_jsonpath`
-        attribute, or it contains a `X-Next-Page` header in the response
-        then you can remove this method.
+        The inventio api doesn't have page-pagination, but we want to get data
+        for many companies. Each company is one independent request, so they are
+        fetched concurrently and their records yielded as each one completes.
 
-        If you need custom pagination that uses page numbers, "next" links, or
-        other approaches, please read the guide: https://sdk.meltano.com/en/v0.25.0/guides/pagination-classes.html.
+        Args:
+            context: Stream partition or context dictionary.
 
-        Returns:
-            A pagination helper instance.
+        Yields:
+            An item for every record in the responses.
         """
-        if self.endpoint_config:
-            return CompanyAPIPaginator(self.endpoint_config["companies"])
-        msg = f"failed to generate paginator because {self.name} was not configured"
-        raise ValueError(msg)
+        if self.endpoint_config is None:
+            msg = f"failed to request records because {self.name} was not configured"
+            raise ValueError(msg)
+
+        decorated_request = self.request_decorator(self._request)
+
+        def fetch_company(
+            page: PaginatorResponse,
+        ) -> tuple[requests.PreparedRequest, requests.Response, list[dict]]:
+            prepared_request = self.prepare_request(context, next_page_token=page)
+            response = decorated_request(prepared_request, context)
+            records = list(self.parse_response(response))
+            for record in records:
+                record["company_name"] = page["company_name"]
+            return prepared_request, response, records
+
+        max_workers = self._max_workers
+        pages: Iterator[PaginatorResponse] = (
+            {"company_name": company_name, "token": token}
+            for company_name, token in self.endpoint_config["companies"].items()
+        )
+
+        with metrics.http_request_counter(
+            self.name,
+            self.path,
+        ) as request_counter, ThreadPoolExecutor(max_workers) as executor:
+            request_counter.context = context
+
+            # at most max_workers requests are in flight, the next company is
+            # only requested once a response has been taken off the set
+            in_flight = {
+                executor.submit(fetch_company, page)
+                for _, page in zip(range(max_workers), pages)
+            }
+            try:
+                while in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    while done:
+                        prepared_request, response, records = done.pop().result()
+                        if (page := next(pages, None)) is not None:
+                            in_flight.add(executor.submit(fetch_company, page))
+                        request_counter.increment()
+                        self.update_sync_costs(prepared_request, response, context)
+                        yield from records
+            finally:
+                # don't send the remaining requests if the sync stops early
+                for future in in_flight:
+                    future.cancel()
 
     def get_url_params(
         self,
@@ -173,11 +226,8 @@ class InventioStream(RESTStream):
         Returns:
             A dictionary of URL query parameters.
         """
-        # keep track of the company to label the rows
-        self._current_company_name = next_page_token["company_name"]
-
         params: dict = {
-            "type": f"{self.name}-GET",
+            "type": self._type_param,
             "token": next_page_token["token"],
         }
 
@@ -240,7 +290,11 @@ class InventioStream(RESTStream):
         Yields:
             Each record from the source.
         """
-        json_response = xmltodict.parse(response.content)
+        # the last tag is forced to a list, so a single record is not unwrapped
+        json_response = xmltodict.parse(
+            response.content,
+            force_list=self._record_path[-1:],
+        )
 
         if "error" in json_response:
             # Inventio does NOT respect normal HTTP status codes, everything is 200
@@ -248,11 +302,12 @@ class InventioStream(RESTStream):
             self.path = self.name  # So the endpoint will be printed in the error
             raise FatalAPIError(self.response_error_message(response))
 
-        if not self.records_jsonpath:
-            msg = "'records_jsonpath' must be specified"
-            raise NotImplementedError(msg)
+        records: Any = json_response
+        for tag in self._record_path:
+            # an empty page parses to None, eg: '<entries/>'
+            records = records.get(tag) if isinstance(records, dict) else None
 
-        yield from extract_jsonpath(self.records_jsonpath, input=json_response)
+        yield from records or ()
 
     def post_process(
         self,
@@ -268,5 +323,4 @@ class InventioStream(RESTStream):
         Returns:
             The updated record dictionary, or ``None`` to skip the record.
         """
-        row["company_name"] = self._current_company_name
         return {key.replace("-", "_"): val for key, val in row.items()}
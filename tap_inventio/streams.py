@@ -79,6 +79,7 @@ class GLEntryStream(InventioStream):
 
     name = "GLEntry"
     records_jsonpath = "$.entries.entry[*]"
+    _record_path = ("entries", "entry")
     primary_keys = ("company_name", "entry_no")
 
 
@@ -87,6 +88,7 @@ class DimensionSetEntry(InventioStream):
 
     name = "DimensionSetEntry"
     records_jsonpath = "$.dimension-entries.dimension-entry[*]"
+    _record_path = ("dimension-entries", "dimension-entry")
     primary_keys = ("company_name", "entry_no", "code")
 
 
@@ -95,6 +97,7 @@ class Customer(InventioStream):
 
     name = "Customer"
     records_jsonpath = "$.customers.customer[*]"
+    _record_path = ("customers", "customer")
     primary_keys = ("company_name", "no")
 
 
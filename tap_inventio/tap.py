@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+from functools import cached_property
+
 from singer_sdk import Tap
 from singer_sdk import typing as th
 from singer_sdk.exceptions import ConfigValidationError
 
 from tap_inventio import streams
-from tap_inventio.client import normalise_name
+from tap_inventio.client import DEFAULT_MAX_WORKERS, normalise_name
+
+# Normalised names of every stream this tap implements
+_STREAM_NAMES: frozenset[str | None] = frozenset(
+    normalise_name(stream.name) for stream in streams.STREAMS
+)
 
 
 class TapInventio(Tap):
@@ -62,8 +69,23 @@ class TapInventio(Tap):
             th.IntegerType,
             description="number of records to get from each endpoint",
         ),
+        th.Property(
+            "max_workers",
+            th.IntegerType,
+            description="number of companies to request concurrently",
+        ),
     ).to_dict()
 
+    @cached_property
+    def _endpoints_by_name(self) -> dict[str | None, list[str]]:
+        """The configured endpoint keys, grouped by their normalised name."""
+        endpoints_by_name: dict[str | None, list[str]] = {}
+        for endpoint_name in self.config["endpoints"]:
+            endpoints_by_name.setdefault(normalise_name(endpoint_name), []).append(
+                endpoint_name,
+            )
+        return endpoints_by_name
+
     def _validate_config(
         self,
         *,
@@ -75,14 +97,24 @@ class TapInventio(Tap):
             warnings_as_errors=warnings_as_errors,
         )
 
-        for endpoint_name, endpoint_config in self.config["endpoints"].items():
-            if normalise_name(endpoint_name) not in [
-                normalise_name(stream.name) for stream in streams.STREAMS
-            ]:
-                warnings.append(
-                    f"endpoint {endpoint_config} was "
-                    f"configured but is not available from this tap",
+        for name, endpoint_names in self._endpoints_by_name.items():
+            if name not in _STREAM_NAMES:
+                # name only, the config holds the company tokens
+                warnings.extend(
+                    f"endpoint {endpoint_name!r} was "
+                    f"configured but is not available from this tap"
+                    for endpoint_name in endpoint_names
                 )
+            elif len(endpoint_names) > 1:
+                # eg: 'GLEntry' and 'GLENTRY-GET' are the same endpoint
+                errors.append(
+                    f"endpoint {name!r} was configured more than once! "
+                    f"({len(endpoint_names)} times)",
+                )
+
+        max_workers = self.config.get("max_workers", DEFAULT_MAX_WORKERS)
+        if max_workers < 1:
+            errors.append(f"max_workers must be at least 1! (got {max_workers})")
 
         if errors:
             error_str = ";\n".join(errors)
@@ -97,13 +129,10 @@ class TapInventio(Tap):
         Returns:
             A list of discovered streams.
         """
-        available_streams_names = {
-            normalise_name(endpoint_name) for endpoint_name in self.config["endpoints"]
-        }
         return [
             stream(self)
             for stream in streams.STREAMS
-            if normalise_name(stream.name) in available_streams_names or True
+            if normalise_name(stream.name) in self._endpoints_by_name
         ]
 
 
@@ -0,0 +1,240 @@
+"""Tests for the stream client, with the Inventio API faked offline."""
+
+from __future__ import annotations
+
+import gzip
+import io
+from typing import Any
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from singer_sdk.exceptions import FatalAPIError
+from urllib3 import HTTPResponse
+
+from tap_inventio.client import InventioStream, normalise_name
+from tap_inventio.tap import TapInventio
+
+TOKEN = "{5B3C070F-BD90-4293-84BB-DCBB1E521B54}"  # noqa: S105
+
+SINGLE_ENTRY = b"""<?xml version="1.0" encoding="utf-8"?>
+<entries>
+    <entry><entry-no>1</entry-no><amount>10.5</amount></entry>
+</entries>
+"""
+
+MULTIPLE_ENTRIES = b"""<?xml version="1.0" encoding="utf-8"?>
+<entries>
+    <entry><entry-no>1</entry-no><amount>10.5</amount></entry>
+    <entry><entry-no>2</entry-no><amount>-3</amount></entry>
+    <entry><entry-no>3</entry-no><amount>0</amount></entry>
+</entries>
+"""
+
+DIMENSION_ENTRIES = b"""<?xml version="1.0" encoding="utf-8"?>
+<dimension-entries>
+    <dimension-entry><dimension-set-id>7</dimension-set-id></dimension-entry>
+    <dimension-entry><dimension-set-id>8</dimension-set-id></dimension-entry>
+</dimension-entries>
+"""
+
+
+def fake_api(
+    monkeypatch: pytest.MonkeyPatch,
+    pages: dict[str, bytes],
+    *,
+    gzipped: bool = True,
+) -> list[str]:
+    """Serve 'pages' (by company name) in place of the API.
+
+    Returns:
+        The company names requested, in the order they were sent.
+    """
+    sent: list[str] = []
+
+    def send(
+        self: requests.Session,  # noqa: ARG001
+        request: requests.PreparedRequest,
+        **kwargs: Any,  # noqa: ARG001
+    ) -> requests.Response:
+        # eg: /{company_name}/smartapi/?type=...
+        company_name = request.path_url.split("/")[1]
+        sent.append(company_name)
+
+        body = pages[company_name]
+        headers: dict[str, str] = {}
+        if gzipped:
+            body = gzip.compress(body)
+            headers["Content-Encoding"] = "gzip"
+
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers=headers,
+            status=200,  # Inventio answers 200 even for errors
+            preload_content=False,
+            decode_content=True,
+        )
+        return HTTPAdapter().build_response(request, raw)
+
+    monkeypatch.setattr(requests.Session, "send", send)
+    return sent
+
+
+def get_stream(
+    stream_name: str,
+    companies: list[str],
+    **config: Any,
+) -> InventioStream:
+    """Build the tap with a single endpoint configured and return its stream."""
+    tap = TapInventio(
+        config={
+            "endpoints": {
+                stream_name: {
+                    "companies": {company_name: TOKEN for company_name in companies},
+                },
+            },
+            **config,
+        },
+        parse_env_config=False,
+    )
+    stream = tap.streams[stream_name]
+    assert isinstance(stream, InventioStream)
+    return stream
+
+
+@pytest.mark.parametrize("gzipped", [True, False])
+def test_single_record_page(
+    monkeypatch: pytest.MonkeyPatch,
+    gzipped: bool,  # noqa: FBT001
+) -> None:
+    """A page with one record still gives one record, not its fields."""
+    fake_api(monkeypatch, {"COMPANY1": SINGLE_ENTRY}, gzipped=gzipped)
+    stream = get_stream("GLEntry", ["COMPANY1"])
+
+    assert list(stream.get_records(None)) == [
+        {"entry_no": "1", "amount": "10.5", "company_name": "COMPANY1"},
+    ]
+
+
+def test_multiple_record_page(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Every record in the page is returned, in document order."""
+    fake_api(monkeypatch, {"COMPANY1": MULTIPLE_ENTRIES})
+    stream = get_stream("GLEntry", ["COMPANY1"])
+
+    records = list(stream.get_records(None))
+
+    assert [record["entry_no"] for record in records] == ["1", "2", "3"]
+    assert {record["company_name"] for record in records} == {"COMPANY1"}
+
+
+def test_hyphenated_record_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Streams find their records under their own tags."""
+    fake_api(monkeypatch, {"COMPANY1": DIMENSION_ENTRIES})
+    stream = get_stream("DimensionSetEntry", ["COMPANY1"])
+
+    assert list(stream.get_records(None)) == [
+        {"dimension_set_id": "7", "company_name": "COMPANY1"},
+        {"dimension_set_id": "8", "company_name": "COMPANY1"},
+    ]
+
+
+def test_empty_page(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A page without records gives no records."""
+    fake_api(monkeypatch, {"COMPANY1": b"<entries/>"})
+    stream = get_stream("GLEntry", ["COMPANY1"])
+
+    assert list(stream.get_records(None)) == []
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"<error>Invalid token</error>",
+        b'<?xml version="1.0" encoding="utf-8"?>\n<error>Invalid token</error>',
+        b"\xef\xbb\xbf<error>Invalid token</error>",
+        b"<!-- generated --><error>Invalid token</error>",
+    ],
+)
+def test_error_document(monkeypatch: pytest.MonkeyPatch, body: bytes) -> None:
+    """An <error> document fails the sync, whatever comes before its root."""
+    fake_api(monkeypatch, {"COMPANY1": body})
+    stream = get_stream("GLEntry", ["COMPANY1"])
+
+    with pytest.raises(FatalAPIError, match="Invalid token"):
+        list(stream.get_records(None))
+
+
+def test_records_labelled_by_company(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Each record carries the company it was requested for."""
+    fake_api(
+        monkeypatch,
+        {"COMPANY1": SINGLE_ENTRY, "COMPANY2": MULTIPLE_ENTRIES},
+    )
+    stream = get_stream("GLEntry", ["COMPANY1", "COMPANY2"])
+
+    records = {
+        (record["company_name"], record["entry_no"])
+        for record in stream.get_records(None)
+    }
+
+    assert records == {
+        ("COMPANY1", "1"),
+        ("COMPANY2", "1"),
+        ("COMPANY2", "2"),
+        ("COMPANY2", "3"),
+    }
+
+
+def test_early_close_stops_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Closing the records early leaves the remaining companies unrequested."""
+    companies = [f"COMPANY{i}" for i in range(50)]
+    sent = fake_api(monkeypatch, dict.fromkeys(companies, SINGLE_ENTRY))
+    max_workers = 2
+    stream = get_stream("GLEntry", companies, max_workers=max_workers)
+
+    records = stream.request_records(None)
+    next(iter(records))
+    records.close()  # type: ignore[attr-defined]
+
+    # the requests in flight, plus the one submitted for the consumed response
+    assert len(sent) <= max_workers + 1
+
+
+def test_every_company_requested_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """With more companies than workers, each company is still requested once."""
+    companies = [f"COMPANY{i}" for i in range(20)]
+    sent = fake_api(monkeypatch, dict.fromkeys(companies, SINGLE_ENTRY))
+    stream = get_stream("GLEntry", companies, max_workers=3)
+
+    records = list(stream.get_records(None))
+
+    assert sorted(sent) == sorted(companies)
+    assert sorted(record["company_name"] for record in records) == sorted(companies)
+
+
+@pytest.mark.parametrize("max_workers", [2, 40])
+def test_connection_pool_fits_workers(max_workers: int) -> None:
+    """Every worker can keep its connection to the API alive."""
+    stream = get_stream("GLEntry", ["COMPANY1"], max_workers=max_workers)
+
+    adapter = stream.requests_session.get_adapter(stream.url_base)
+
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == max_workers
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("GLENTRY", "GLENTRY"),
+        ("GLEntry", "GLENTRY"),
+        ("GLEntry-GET", "GLENTRY"),
+        ("GLENTRY-GET", "GLENTRY"),
+        ("DimensionSetEntry", "DIMENSIONSETENTRY"),
+        ("ITEM-POST", None),
+        ("item-post", None),
+    ],
+)
+def test_normalise_name(name: str, expected: str | None) -> None:
+    """Endpoint names compare equal however they are written."""
+    assert normalise_name(name) == expected
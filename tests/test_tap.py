@@ -0,0 +1,48 @@
+"""Tests for the tap's endpoint configuration."""
+
+from __future__ import annotations
+
+import pytest
+from singer_sdk.exceptions import ConfigValidationError
+
+from tap_inventio.tap import TapInventio
+
+COMPANIES = {"companies": {"COMPANY1": "{5B3C070F-BD90-4293-84BB-DCBB1E521B54}"}}
+
+
+def test_duplicate_endpoint() -> None:
+    """The same endpoint under two spellings is rejected."""
+    config = {"endpoints": {"GLEntry": COMPANIES, "GLENTRY-GET": COMPANIES}}
+
+    with pytest.raises(ConfigValidationError, match="'GLENTRY' was configured more"):
+        TapInventio(config=config, parse_env_config=False)
+
+
+def test_unknown_endpoint() -> None:
+    """Unknown endpoints are warned about by name, without their tokens."""
+    config = {"endpoints": {"GLEntry": COMPANIES, "ITEM": COMPANIES}}
+    tap = TapInventio(config=config, parse_env_config=False)
+
+    warnings, errors = tap._validate_config()  # noqa: SLF001
+
+    assert errors == []
+    assert warnings == [
+        "endpoint 'ITEM' was configured but is not available from this tap",
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_max_workers_below_one(max_workers: int) -> None:
+    """A worker count below one is rejected when the tap is built."""
+    config = {"endpoints": {"GLEntry": COMPANIES}, "max_workers": max_workers}
+
+    with pytest.raises(ConfigValidationError, match="max_workers must be at least 1"):
+        TapInventio(config=config, parse_env_config=False)
+
+
+def test_discover_configured_streams() -> None:
+    """Only the configured endpoints are discovered."""
+    config = {"endpoints": {"GLENTRY": COMPANIES, "Customer-GET": COMPANIES}}
+    tap = TapInventio(config=config, parse_env_config=False)
+
+    assert sorted(tap.streams) == ["Customer", "GLEntry"]